@@ -6,7 +6,33 @@ when a safety concern is detected. In production, this would integrate
 with SMS, push notifications, and phone call APIs.
 """
 
-from ui_utils import Colors
+import asyncio
+import sys
+
+from ui_utils import ALERT_HEADER_60, BANG_BAR_60, Colors
+
+_RED, _BOLD, _RESET = Colors.BRIGHT_RED, Colors.BOLD, Colors.RESET
+_GREEN, _CYAN, _YELLOW = Colors.BRIGHT_GREEN, Colors.CYAN, Colors.YELLOW
+
+# Pre-saved emergency contacts as parallel columns: contact i is
+# (_CONTACT_NAMES[i], _CONTACT_PHONES[i])
+# In production: loaded from the user's profile during onboarding
+_CONTACT_NAMES = ("Mother", "Father", "Trusted Friend")
+_CONTACT_PHONES = ("(123) 456-7890", "(123) 456-7891", "(123) 456-7892")
+_ALERT_MESSAGE = "Safety concern detected. Please check on me."
+
+# The static parts of the alert banner are rendered once at import
+_ALERT_HEADER = "\n".join([
+    f"\n{_RED}{_BOLD}{BANG_BAR_60}",
+    ALERT_HEADER_60,
+    f"{BANG_BAR_60}{_RESET}",
+    f"\n{_YELLOW}Notifying contacts...{_RESET}",
+]) + "\n"
+_ALERT_FOOTER = "\n".join([
+    f"\n{_CYAN}Alert Message:{_RESET}",
+    f"  {_BOLD}'{_ALERT_MESSAGE}'{_RESET}",
+    f"\n{_RED}{BANG_BAR_60}{_RESET}\n",
+]) + "\n"
 
 
 class AlertSystem:
@@ -28,17 +54,38 @@ class AlertSystem:
         Emergency contacts would be configured during user onboarding and
         stored securely in the user's profile.
     """
+    __slots__ = ('_alert_text',)
+
+    def __init__(self):
+        """
+        Load the pre-saved emergency contacts.
+
+        Contacts are fixed for the lifetime of the instance, so the console
+        alert listing them is rendered once here and reused by every
+        send_alert() call.
+        """
+        contacts = "\n".join(
+            f"  {_GREEN}✓{_RESET} {name} - {phone}"
+            for name, phone in zip(_CONTACT_NAMES, _CONTACT_PHONES)
+        )
+        self._alert_text = _ALERT_HEADER + contacts + "\n" + _ALERT_FOOTER
 
-    def send_alert(self):
+    async def send_alert(self):
         """
         Send emergency alert to all pre-configured contacts.
 
+        Synchronous callers should use send_alert_sync().
+
         Displays a simulated alert notification. In production, this would:
         1. Send SMS to each emergency contact with user's location
         2. Send push notifications to contacts' phones
         3. Optionally initiate automated phone calls
         4. Log the alert event for safety records
 
+        Each channel would be one bulk provider request (e.g. one Twilio bulk
+        SMS, one FCM multicast) covering every contact, awaited here before
+        the confirmation is printed. The simulation only prints it.
+
         The alert message includes:
             - Timestamp of the alert
             - User's current GPS location (in production)
@@ -47,18 +94,19 @@ class AlertSystem:
 
         Example:
             >>> alert_system = AlertSystem()
-            >>> alert_system.send_alert()
+            >>> await alert_system.send_alert()
             🚨 EMERGENCY ALERT SENT TO PRE-SAVED CONTACTS 🚨
             ✓ Mother - (123) 456-7890
             ...
         """
-        print("\n" + Colors.BRIGHT_RED + Colors.BOLD + "!"*60)
-        print("  🚨  EMERGENCY ALERT SENT TO PRE-SAVED CONTACTS  🚨  ".center(60))
-        print("!"*60 + Colors.RESET)
-        print(f"\n{Colors.YELLOW}Notifying contacts...{Colors.RESET}")
-        print(f"  {Colors.BRIGHT_GREEN}✓{Colors.RESET} Mother - (123) 456-7890")
-        print(f"  {Colors.BRIGHT_GREEN}✓{Colors.RESET} Father - (123) 456-7891")
-        print(f"  {Colors.BRIGHT_GREEN}✓{Colors.RESET} Trusted Friend - (123) 456-7892")
-        print(f"\n{Colors.CYAN}Alert Message:{Colors.RESET}")
-        print(f"  {Colors.BOLD}'Safety concern detected. Please check on me.'{Colors.RESET}")
-        print(f"\n{Colors.BRIGHT_RED}" + "!"*60 + Colors.RESET + "\n")
+        sys.stdout.write(self._alert_text)
+        sys.stdout.flush()
+
+    def send_alert_sync(self):
+        """
+        Send emergency alert from synchronous code.
+
+        Blocking wrapper that runs send_alert() to completion on a fresh
+        event loop.
+        """
+        asyncio.run(self.send_alert())
@@ -5,7 +5,15 @@ This module stores the user's normal/baseline physiological measurements
 used as a reference point for detecting abnormalities.
 """
 
+from dataclasses import dataclass
+from typing import Final
 
+# Default baseline - typical adult resting heart rate
+# Hot paths can compare against this constant without touching an instance
+BASELINE_HEART_RATE: Final[int] = 75
+
+
+@dataclass(frozen=True, slots=True)
 class BaselineData:
     """
     Stores baseline health metrics for a user.
@@ -14,32 +22,23 @@ class BaselineData:
     baseline measurements. These values are used by the anomaly detection
     algorithm to determine what constitutes "abnormal" for this specific user.
 
+    Instances are immutable and slotted, so reading a baseline value is a
+    direct slot load rather than a property call.
+
     Attributes:
-        _baseline_heart_rate (int): User's typical resting heart rate in bpm
+        baseline_heart_rate (int): User's typical resting heart rate in bpm.
+                                   Typically ranges from 60-100 bpm for
+                                   healthy adults.
 
     Note:
         In a production system, this would load from a database or user profile.
         The default of 75 bpm is a typical adult resting heart rate.
     """
 
-    def __init__(self):
-        """
-        Initialize baseline data with default values.
-
-        In production, this would be populated from user configuration
-        or calculated from historical data during onboarding.
-        """
-        # Default baseline - typical adult resting heart rate
-        # In production: load from user profile or database
-        self._baseline_heart_rate = 75
-
-    @property
-    def baseline_heart_rate(self) -> int:
-        """
-        Get the user's baseline resting heart rate.
-
-        Returns:
-            int: Baseline heart rate in beats per minute (bpm).
-                 Typically ranges from 60-100 bpm for healthy adults.
-        """
-        return self._baseline_heart_rate
+    # In production: load from user profile or database
+    baseline_heart_rate: int = BASELINE_HEART_RATE
+
+
+# Shared instance for the default baseline; BaselineData is immutable, so
+# there is no need to allocate a fresh one per monitoring session
+DEFAULT_BASELINE: Final[BaselineData] = BaselineData()
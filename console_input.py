@@ -0,0 +1,117 @@
+"""
+Line-oriented stdin reader shared by the setup prompts and timed prompts.
+
+Every read of stdin in the application goes through this module. Bytes are
+pulled straight from the file descriptor with os.read(), split into lines,
+and queued here. This matters because a buffered reader such as input() or
+sys.stdin.readline() may pull several lines off a pipe at once and return
+only the first: the remaining lines then sit in a Python buffer where a
+select()/event-loop wait on the descriptor can never see them. Keeping the
+only buffer here means a waiting caller always checks pending_line() first.
+
+End of file is reported once per read that hits it, as input() does: on a
+terminal, Ctrl+D fails one read and the next one waits for the user again,
+while a closed pipe or file simply hits end of file on every read.
+
+Key Components:
+    - read_line: Blocking replacement for input() (setup and "Press Enter")
+    - pending_line / read_available / take_eof: Primitives used by the
+      monitor's timed prompts to wait on the descriptor without losing lines
+"""
+
+import os
+import sys
+from collections import deque
+from typing import Optional
+
+# Complete lines read from stdin but not yet handed to a caller
+_pending = deque()
+# Bytes received after the last newline (a line still being typed/sent)
+_partial = bytearray()
+# End of file read and not yet reported to a caller (see take_eof)
+_eof = False
+
+_READ_SIZE = 4096
+
+
+def _stdin_fd() -> int:
+    """File descriptor of stdin"""
+    return sys.stdin.fileno()
+
+
+def _decode(raw: bytes) -> str:
+    """Decode one raw line with stdin's encoding, dropping the line ending"""
+    return raw.rstrip(b"\r").decode(sys.stdin.encoding or "utf-8", errors="replace")
+
+
+def read_available() -> bool:
+    """
+    Read whatever stdin has available (one os.read call) into the line queue.
+
+    Blocks if nothing is available yet, so callers waiting with a timeout
+    should only call this once the descriptor is readable.
+
+    Returns:
+        bool: False if this read hit end of file, True otherwise
+    """
+    global _eof
+    data = os.read(_stdin_fd(), _READ_SIZE)
+    if not data:
+        if _partial:
+            # Final line without a trailing newline still counts, as with input()
+            _pending.append(_decode(bytes(_partial)))
+            _partial.clear()
+        else:
+            _eof = True
+        return False
+
+    _partial.extend(data)
+    *lines, rest = _partial.split(b"\n")
+    _pending.extend(_decode(line) for line in lines)
+    _partial[:] = rest
+    return True
+
+
+def pending_line() -> Optional[str]:
+    """Return the next already-received line, or None if none is queued"""
+    return _pending.popleft() if _pending else None
+
+
+def take_eof() -> bool:
+    """
+    Report an end of file that was read after every queued line.
+
+    The flag is cleared once reported, so a Ctrl+D on a terminal fails only
+    the current read. A closed pipe reports end of file again on its next
+    read, so it is never mistaken for an open one.
+
+    Returns:
+        bool: True if the caller should raise EOFError
+    """
+    global _eof
+    if not _eof or _pending:
+        return False
+    _eof = False
+    return True
+
+
+def read_line(prompt: str = "") -> str:
+    """
+    Print a prompt and block until a full line is read, like input().
+
+    Args:
+        prompt (str, optional): Text written to stdout before reading
+
+    Returns:
+        str: The line without its line ending
+
+    Raises:
+        EOFError: If stdin is closed before a line arrives, matching input()
+    """
+    if prompt:
+        sys.stdout.write(prompt)
+    sys.stdout.flush()
+    while not _pending:
+        if not read_available() and take_eof():
+            raise EOFError()
+    return _pending.popleft()
@@ -7,6 +7,7 @@ interface design and testing terminal color support.
 
 Usage:
     python3 demo_ui.py
+    DEMO_NO_SLEEP=1 python3 demo_ui.py   # skip animation delays (CI/smoke tests)
 
 The demo displays:
     - Header and subheader styles
@@ -18,10 +19,18 @@ The demo displays:
     - Emergency alert styling
 """
 
-from ui_utils import UI, Colors
-import time
+from ui_utils import ALERT_HEADER_60, BANG_BAR_60, UI, Colors
+import io
+import os
+import sys
 
-def demo():
+_RED, _BOLD, _RESET = Colors.BRIGHT_RED, Colors.BOLD, Colors.RESET
+_GREEN, _CYAN = Colors.BRIGHT_GREEN, Colors.CYAN
+
+# The demo animates a fixed 4-step load, so its frames are rendered once
+_PROGRESS_FRAMES = tuple(UI.render_progress_bar(i, 4) + "\n" for i in range(1, 5))
+
+def demo(delay: float = 0.3):
     """
     Run the UI demonstration.
 
@@ -37,6 +46,11 @@ def demo():
     This demo simulates the visual experience of the actual monitoring
     system without requiring user input or running the health algorithms.
 
+    Args:
+        delay (float, optional): Seconds to pause between progress bar frames.
+                                 Pass 0 to skip the animation delay entirely.
+                                 Defaults to 0.3.
+
     Example:
         $ python3 demo_ui.py
         ════════════════════════════════════════════════════════════
@@ -44,57 +58,76 @@ def demo():
         ════════════════════════════════════════════════════════════
         ...
     """
+    # Only the demo animation needs time; keep it out of the module import
+    import time
+
+    # Static sections are rendered into a buffer and written out at each
+    # natural boundary; only the animated progress bar goes straight out
+    buf = io.StringIO()
+
     # Header
-    UI.header("PERSONAL SAFETY MONITORING SYSTEM", Colors.BRIGHT_MAGENTA)
+    UI.header("PERSONAL SAFETY MONITORING SYSTEM", Colors.BRIGHT_MAGENTA, file=buf)
 
     # Subheader
-    UI.subheader("⚙️  CONFIGURATION SETUP", Colors.BRIGHT_BLUE)
+    UI.subheader("⚙️  CONFIGURATION SETUP", Colors.BRIGHT_BLUE, file=buf)
 
     # Success/Warning/Error messages
-    UI.success("Configuration loaded successfully")
-    UI.warning("Low battery detected")
-    UI.error("Connection failed")
-    UI.info("System initialized", "ℹ️")
+    UI.success("Configuration loaded successfully", file=buf)
+    UI.warning("Low battery detected", file=buf)
+    UI.error("Connection failed", file=buf)
+    UI.info("System initialized", "ℹ️", file=buf)
 
     # Status box
     config_items = [
-        f"{Colors.GREEN}Baseline Heart Rate:{Colors.RESET} 75 bpm",
-        f"{Colors.GREEN}PIN Protection:{Colors.RESET} Enabled (1234)",
-        f"{Colors.GREEN}Emergency Contacts:{Colors.RESET} 3 configured",
+        f"{Colors.GREEN}Baseline Heart Rate:{_RESET} 75 bpm",
+        f"{Colors.GREEN}PIN Protection:{_RESET} Enabled (1234)",
+        f"{Colors.GREEN}Emergency Contacts:{_RESET} 3 configured",
     ]
-    UI.status_box("CONFIGURATION SUMMARY", config_items)
+    UI.status_box("CONFIGURATION SUMMARY", config_items, file=buf)
 
     # Progress bar
-    print(f"\n{Colors.BOLD}Loading initial data:{Colors.RESET}")
-    for i in range(1, 5):
-        UI.progress_bar(i, 4)
-        time.sleep(0.3)
+    buf.write(f"\n{_BOLD}Loading initial data:{_RESET}\n")
+    _flush_buffer(buf)
+    for frame in _PROGRESS_FRAMES:
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        if delay:
+            time.sleep(delay)
 
     # Cycle header
-    UI.cycle_header(5)
+    UI.cycle_header(5, file=buf)
 
     # Abnormality gauges at different levels
-    print(f"\n{Colors.BOLD}Abnormality Level Examples:{Colors.RESET}\n")
+    buf.write(f"\n{_BOLD}Abnormality Level Examples:{_RESET}\n\n")
 
-    print("Normal level (20%):")
-    UI.abnormality_gauge(20)
+    buf.write("Normal level (20%):\n")
+    UI.abnormality_gauge(20, file=buf)
 
-    print("\nElevated level (40%):")
-    UI.abnormality_gauge(40)
+    buf.write("\nElevated level (40%):\n")
+    UI.abnormality_gauge(40, file=buf)
 
-    print("\nHigh level (60%):")
-    UI.abnormality_gauge(60)
+    buf.write("\nHigh level (60%):\n")
+    UI.abnormality_gauge(60, file=buf)
 
-    print("\nCritical level (85%):")
-    UI.abnormality_gauge(85)
+    buf.write("\nCritical level (85%):\n")
+    UI.abnormality_gauge(85, file=buf)
 
     # Alert
-    print("\n" + Colors.BRIGHT_RED + Colors.BOLD + "!"*60)
-    print("  🚨  EMERGENCY ALERT SENT TO PRE-SAVED CONTACTS  🚨  ".center(60))
-    print("!"*60 + Colors.RESET)
+    buf.write("\n" + _RED + _BOLD + BANG_BAR_60 + "\n")
+    buf.write(ALERT_HEADER_60 + "\n")
+    buf.write(BANG_BAR_60 + _RESET + "\n")
+
+    buf.write(f"\n{_GREEN}Demo complete!{_RESET}\n")
+    buf.write(f"{_CYAN}The actual monitoring system will look similar to this.{_RESET}\n\n")
+    _flush_buffer(buf)
+
 
-    print(f"\n{Colors.BRIGHT_GREEN}Demo complete!{Colors.RESET}")
-    print(f"{Colors.CYAN}The actual monitoring system will look similar to this.{Colors.RESET}\n")
+def _flush_buffer(buf: io.StringIO):
+    """Write buffered demo output to stdout in one call and reset the buffer"""
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    buf.seek(0)
+    buf.truncate(0)
 
 if __name__ == "__main__":
-    demo()
+    demo(delay=0.0 if os.getenv("DEMO_NO_SLEEP") else 0.3)
@@ -8,60 +8,293 @@ emergency alert escalation.
 
 Key Components:
     - HealthMonitor: Main monitoring class with state machine
-    - TimeoutError: Custom exception for user response timeouts
-    - timeout_handler: SIGALRM signal handler for timed prompts
+    - State / Action / _TRANSITIONS: Table mapping each state to the cycle's action
+    - _timed_input: Awaitable stdin read with a timeout for timed prompts
+      (reads through console_input so typed-ahead lines are never lost)
 
 Algorithm Overview:
-    1. Collect initial data (cycles 1-4)
+    1. Collect initial data until the window is full (cycles 1-4)
     2. Calculate abnormality from sliding window of 5 readings
     3. Abnormality only flagged when: (HR<50 or HR>80) AND no motion
-    4. Escalation at 45%+ abnormality with 15-second user response window
+    4. Escalation above 45% abnormality with 15-second user response window;
+       once enough normal cycles are seen, the threshold adapts to the user
+       (median + robust z-score over recent normal scores, kept within 30-45%,
+       so adapting can only make the check stricter)
     5. Track consecutive abnormal cycles after user confirms safety
     6. Sharp jump detection (>20% increase) triggers immediate check
     7. Final safety check on watch removal
 
 State Machine States:
-    - awaiting_user_response: Waiting for delayed response to previous alert
-    - user_previously_said_safe: Tracking consecutive abnormals after confirmation
+    - state: State.IDLE, State.PREV_SAFE (tracking consecutive abnormals after
+      confirmation) or State.AWAITING_RESPONSE (alert sent, ask again next cycle)
     - consecutive_abnormal_after_yes: Counter for abnormal cycles (0-indexed)
-    - alert_sent: Whether emergency alert has been triggered
     - last_abnormality: Previous cycle's score for jump detection
 """
 
+import asyncio
+import hmac
+import io
+import sys
 import time
-import signal
-from typing import List, Optional
-from sensor_reading import SensorReading
+from bisect import bisect_left, insort
+from collections import deque
+from enum import IntEnum
+from functools import lru_cache
+from itertools import product
+from typing import Optional
+from baseline_data import BASELINE_HEART_RATE
 from sensor_simulator import SensorSimulator
 from alert_system import AlertSystem
+import console_input
 from ui_utils import UI, Colors
 
+if sys.platform == "win32":
+    import msvcrt
+
+# Readings in the sliding window; scoring starts once it is full
+WINDOW_SIZE = 5
+
+# Fixed console fragments, with their color codes resolved once at import
+# rather than re-interpolated on every cycle
+_END_MONITORING_HELP = (
+    f"{Colors.CYAN}📱 To end monitoring:{Colors.RESET}\n"
+    f"   • Type {Colors.BOLD}REMOVE{Colors.RESET} or {Colors.BOLD}REMOVED{Colors.RESET} (+ PIN if enabled) after any cycle\n"
+    f"   • Or press {Colors.BOLD}CTRL+C{Colors.RESET} anytime\n"
+    f"\n{Colors.GREEN}System will perform a final safety check before ending.{Colors.RESET}\n"
+)
+_COLLECTING_PREFIX = f"{Colors.YELLOW}📊 Collecting initial data... ("
+_COLLECTING_SUFFIX = f"/{WINDOW_SIZE}){Colors.RESET}"
+_HR_PREFIX = f"{Colors.CYAN}Heart Rate:{Colors.RESET} {Colors.BOLD}"
+_HR_SUFFIX = f" bpm{Colors.RESET}"
+_MOTION_LINES = (  # indexed by motion_detected
+    f"{Colors.CYAN}Motion:{Colors.RESET} 🧍 Not Detected",
+    f"{Colors.CYAN}Motion:{Colors.RESET} 🏃 Detected",
+)
+_WARMUP_ABNORMALITY = f"{Colors.GREEN}Abnormality: 0%{Colors.RESET}"
+_CONTINUE_HEADER = f"\n{Colors.CYAN}To continue to next cycle or end monitoring:{Colors.RESET}"
+
+
+def _case_variants(*words: str) -> frozenset:
+    """Every upper/lower-case spelling of the given words"""
+    return frozenset(
+        "".join(chars)
+        for word in words
+        for chars in product(*zip(word.lower(), word.upper()))
+    )
+
+
+# Command vocabulary in every letter case, so a typed token can be matched
+# case-insensitively with one set lookup instead of upper() and compares
+_YES_TOKENS = _case_variants("YES")
+_REMOVE_TOKENS = _case_variants("REMOVE", "REMOVED")
+
+
+async def _timed_input(timeout: float) -> Optional[str]:
+    """
+    Read one line from stdin, waiting at most `timeout` seconds.
+
+    Lines are taken from the shared console_input queue, so a line that
+    arrived together with an earlier one (typed ahead, or piped) is returned
+    immediately instead of being stranded in a stdin buffer. Otherwise stdin
+    is registered with the running event loop while waiting, so no signal
+    handler has to be installed around every prompt and the loop stays free
+    for other tasks. On Windows, where the event loop cannot watch console
+    handles, the console is polled with msvcrt instead.
+
+    Args:
+        timeout (float): Maximum seconds to wait for a complete line
+
+    Returns:
+        Optional[str]: The line with surrounding whitespace stripped,
+                       or None if the timeout expired
+
+    Raises:
+        EOFError: If stdin is closed, matching input()
+    """
+    sys.stdout.flush()  # make sure the prompt is visible, as input() would
+    line = console_input.pending_line()
+    if line is not None:
+        return line.strip()
+    if console_input.take_eof():
+        raise EOFError()
+    if sys.platform == "win32":
+        return await _timed_input_windows(timeout)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    fd = sys.stdin.fileno()
+    while True:
+        ready = loop.create_future()
+
+        def on_readable():
+            if not ready.done():
+                ready.set_result(None)
 
-class TimeoutError(Exception):
+        try:
+            loop.add_reader(fd, on_readable)
+        except PermissionError:
+            pass  # stdin redirected from a regular file, which is always readable
+        else:
+            try:
+                await asyncio.wait_for(ready, max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                loop.remove_reader(fd)
+
+        # Readable: take what is there; it may be only part of a line
+        console_input.read_available()
+        line = console_input.pending_line()
+        if line is not None:
+            return line.strip()
+        if console_input.take_eof():
+            raise EOFError()
+
+
+async def _timed_input_windows(timeout: float) -> Optional[str]:
+    """Windows fallback for _timed_input that polls the console keyboard"""
+    deadline = time.monotonic() + timeout
+    chars = []
+    while time.monotonic() < deadline:
+        while msvcrt.kbhit():
+            char = msvcrt.getwche()
+            if char in ("\r", "\n"):
+                sys.stdout.write("\n")
+                return "".join(chars).strip()
+            if char == "\b":
+                if chars:
+                    chars.pop()
+            else:
+                chars.append(char)
+        await asyncio.sleep(0.05)
+    return None
+
+
+def _hr_points(hr: int) -> int:
+    """Abnormality points for one stationary reading at the given heart rate"""
+    # Higher deviation = higher score
+    if hr > 110:
+        return 25
+    elif hr > 100:
+        return 20
+    elif hr > 90:
+        return 15
+    elif hr > 80:
+        return 10
+    elif hr < 45:
+        return 20
+    elif hr < 50:
+        return 10
+    return 0
+
+
+# Points per bpm (0-255), precomputed once so scoring is a table lookup
+# instead of a comparison ladder per reading
+_HR_SCORE = bytes(_hr_points(hr) for hr in range(256))
+
+# The window is packed into two ints: one 8-bit heart-rate lane per reading
+# (newest reading in the lowest byte) and a motion mask with one bit per
+# reading (newest in bit 0)
+_HR_LANES_MASK = (1 << 8 * WINDOW_SIZE) - 1
+_MOTION_MASK = (1 << WINDOW_SIZE) - 1
+
+
+@lru_cache(maxsize=256)
+def _score_window(hr_lanes: int, motion_bits: int) -> int:
     """
-    Custom exception raised when user fails to respond within timeout period.
+    Score a window of readings packed into heart-rate lanes and a motion mask.
 
-    Used in conjunction with SIGALRM signal handling to implement timed
-    prompts for safety checks.
+    Each 8-bit lane is mapped to points through the _HR_SCORE table; points
+    only count for lanes whose motion bit is clear. Results are cached by
+    window contents, since a resting wearer often produces the same window
+    several cycles in a row.
+    See HealthMonitor._calculate_abnormality for the scoring rules.
     """
-    pass
+    total = 0
+    for shift in range(WINDOW_SIZE):
+        if not motion_bits >> shift & 1:
+            total += _HR_SCORE[hr_lanes >> (shift * 8) & 0xFF]
+    return min(100, total)
 
 
-def timeout_handler(signum, frame):
+def _sorted_median(values) -> float:
+    """Median of an already-sorted sequence, read directly from the middle"""
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
+
+
+def _sorted_mad(values, center: float) -> float:
     """
-    Signal handler for SIGALRM timeout events.
+    Median absolute deviation of an already-sorted sequence from `center`.
 
-    Raises TimeoutError when the alarm signal is received, allowing
-    the monitoring system to handle non-responses gracefully.
+    Deviations grow walking outward from the center on either side, so the
+    smaller half of them is collected by merging the two sides in order
+    instead of sorting every deviation.
+    """
+    n = len(values)
+    hi = bisect_left(values, center)
+    lo = hi - 1
+    deviations = []
+    for _ in range(n // 2 + 1):
+        if hi < n and (lo < 0 or values[hi] - center <= center - values[lo]):
+            deviations.append(values[hi] - center)
+            hi += 1
+        else:
+            deviations.append(center - values[lo])
+            lo -= 1
+    mid = n // 2
+    if n % 2:
+        return deviations[mid]
+    return (deviations[mid - 1] + deviations[mid]) / 2
 
-    Args:
-        signum: Signal number (SIGALRM)
-        frame: Current stack frame (unused)
 
-    Raises:
-        TimeoutError: Always raised to break out of input() blocking call
+class State(IntEnum):
+    """Where the safety-response state machine is between cycles"""
+    IDLE = 0  # Nothing being tracked
+    PREV_SAFE = 1  # User said 'yes'; counting consecutive abnormal cycles
+    AWAITING_RESPONSE = 2  # Prompt went unanswered and an alert was sent
+
+
+class Action(IntEnum):
+    """What the monitoring loop does with a scored cycle (cycle 5 onwards)"""
+    NORMAL = 0  # Normal reading, nothing being tracked
+    RESET = 1  # Normal reading ends consecutive tracking after a 'yes'
+    NOTE = 2  # Abnormal after a 'yes' (1st/2nd consecutive) - note and continue
+    PROMPT = 3  # Abnormal with no prior 'yes' - ask the user
+    SHARP_JUMP = 4  # Abnormal after a 'yes' with a sharp jump - ask immediately
+    THIRD_ABNORMAL = 5  # 3rd consecutive abnormal after a 'yes' - ask again
+    RECHECK = 6  # Previous prompt went unanswered - ask again regardless
+
+
+def _build_transitions() -> dict:
+    """
+    Build the state-machine transition table.
+
+    Keys are (state, over_threshold, sharp_jump, third_consecutive) tuples;
+    every combination maps to the Action the monitoring loop should take.
     """
-    raise TimeoutError()
+    table = {}
+    for key in product(State, (False, True), (False, True), (False, True)):
+        state, over_threshold, sharp_jump, third_consecutive = key
+        if state == State.AWAITING_RESPONSE:
+            action = Action.RECHECK
+        elif not over_threshold:
+            action = Action.RESET if state == State.PREV_SAFE else Action.NORMAL
+        elif state == State.IDLE:
+            action = Action.PROMPT
+        elif sharp_jump:
+            action = Action.SHARP_JUMP
+        elif third_consecutive:
+            action = Action.THIRD_ABNORMAL
+        else:
+            action = Action.NOTE
+        table[key] = action
+    return table
+
+
+_TRANSITIONS = _build_transitions()
 
 
 class HealthMonitor:
@@ -78,16 +311,27 @@ class HealthMonitor:
         CYCLE_DELAY (int): Gap between monitoring cycles (10s)
         ESCALATION_THRESHOLD (int): Abnormality % to trigger user check (45%)
         SHARP_JUMP_THRESHOLD (int): % increase for immediate check (20%)
+        SAMPLES_PER_CYCLE (int): Sensor samples read per cycle in one batch (1)
+        BASELINE_WINDOW (int): Recent normal-cycle scores kept for adaptation (64)
+        BASELINE_MIN_CYCLES (int): Normal cycles needed before adapting (16)
+        ROBUST_Z_THRESHOLD (float): Modified z-score counted as abnormal (3.5)
+        MIN_MAD (int): Floor for the baseline's median absolute deviation (5)
+        ADAPTIVE_THRESHOLD_RANGE (tuple): Bounds for the adaptive threshold (30-45%)
 
     Attributes:
         baseline_heart_rate (int): User's configured resting heart rate
         safety_pin (str): Optional PIN for response authentication
         alert_system (AlertSystem): Emergency contact notification system
-        last_five_readings (List[SensorReading]): Sliding window for calculation
-        awaiting_user_response (bool): Waiting for delayed response flag
+        simulator (SensorSimulator): Source of simulated sensor samples
+        _hr_lanes (int): Last WINDOW_SIZE heart rates (bpm) packed into 8-bit lanes
+        _motion_bits (int): Last WINDOW_SIZE motion flags packed into a bit mask
+        _filled (int): Readings currently held in the window (0-WINDOW_SIZE)
+        _out (io.StringIO): Buffered output of the current cycle
+        _baseline_scores (deque): Abnormality scores of recent normal cycles
+        _baseline_sorted (list): The same scores kept in sorted order
+        _escalation_threshold (float): Current (possibly adapted) escalation threshold
+        state (State): Current safety-response state
         consecutive_abnormal_after_yes (int): Counter for consecutive abnormals
-        user_previously_said_safe (bool): User confirmed safety flag
-        alert_sent (bool): Emergency alert has been sent flag
         last_abnormality (Optional[float]): Previous cycle's abnormality score
 
     Example:
@@ -95,12 +339,28 @@ class HealthMonitor:
         >>> monitor.start_monitoring()
         # Begins continuous monitoring with PIN protection
     """
+    __slots__ = (
+        'baseline_heart_rate', 'safety_pin', '_safety_pin_bytes', 'alert_system', 'simulator',
+        '_hr_lanes', '_motion_bits', '_filled', '_out',
+        '_baseline_scores', '_baseline_sorted', '_escalation_threshold',
+        'state', 'consecutive_abnormal_after_yes', 'last_abnormality',
+    )
+
     RESPONSE_TIMEOUT = 15  # seconds - user has 15s to respond
     CYCLE_DELAY = 10  # seconds - 10s gap between cycles
     ESCALATION_THRESHOLD = 45  # 45%+ requires user confirmation
     SHARP_JUMP_THRESHOLD = 20  # >20% jump after yes triggers immediate check
-
-    def __init__(self, baseline_heart_rate: int = 75, safety_pin: str = ""):
+    SAMPLES_PER_CYCLE = 1  # sensor samples ingested per cycle (last 5 form the window)
+    BASELINE_WINDOW = 64  # normal-cycle scores kept for the adaptive threshold
+    BASELINE_MIN_CYCLES = 16  # use the fixed threshold until this many normal cycles
+    ROBUST_Z_THRESHOLD = 3.5  # modified z-score above which a score is abnormal
+    MIN_MAD = 5  # spread floor (points) so a flat baseline doesn't flag every reading
+    # Never below ELEVATED, never above the fixed threshold: adapting may only
+    # make the check stricter
+    ADAPTIVE_THRESHOLD_RANGE = (30, ESCALATION_THRESHOLD)
+
+    def __init__(self, baseline_heart_rate: int = BASELINE_HEART_RATE, safety_pin: str = "",
+                 simulator: Optional[SensorSimulator] = None):
         """
         Initialize the health monitoring system.
 
@@ -109,6 +369,10 @@ class HealthMonitor:
                                                  Defaults to 75 (typical adult rate).
             safety_pin (str, optional): 4-6 digit PIN for response authentication.
                                        Empty string disables PIN protection.
+            simulator (SensorSimulator, optional): Sensor source with its own
+                                                   random stream (see
+                                                   SensorSimulator.spawn).
+                                                   Defaults to a new simulator.
 
         Example:
             >>> monitor = HealthMonitor(baseline_heart_rate=68, safety_pin="1234")
@@ -116,14 +380,26 @@ class HealthMonitor:
         """
         self.baseline_heart_rate = baseline_heart_rate
         self.safety_pin = safety_pin  # PIN required for YES and REMOVE commands
+        self._safety_pin_bytes = safety_pin.encode()  # encoded once for _pin_matches
         self.alert_system = AlertSystem()
-        self.last_five_readings: List[SensorReading] = []
+        self.simulator = simulator if simulator is not None else SensorSimulator()
+        # Sliding window of the last WINDOW_SIZE readings, packed into two
+        # ints so the whole window is a pair of small values (see _push_samples)
+        self._hr_lanes = 0  # one 8-bit heart rate per lane, clamped to 0-255 bpm
+        self._motion_bits = 0  # bit set if motion detected
+        self._filled = 0  # scoring starts once every lane holds a real reading
+
+        # Per-cycle output buffer, reused across cycles (see _flush_output)
+        self._out = io.StringIO()
+
+        # Recent normal-cycle scores for the per-user escalation threshold
+        self._baseline_scores = deque(maxlen=self.BASELINE_WINDOW)  # arrival order
+        self._baseline_sorted = []  # sorted copy, updated per score (see _record_normal_score)
+        self._escalation_threshold: float = self.ESCALATION_THRESHOLD
 
         # State tracking for intelligent response management
-        self.awaiting_user_response = False  # True if we need to ask user again due to no response
+        self.state = State.IDLE  # AWAITING_RESPONSE if we need to ask user again due to no response
         self.consecutive_abnormal_after_yes = 0  # Track consecutive abnormal cycles after user said yes
-        self.user_previously_said_safe = False  # Flag to show "user previously said safe"
-        self.alert_sent = False  # Track if alert has been sent
         self.last_abnormality: Optional[float] = None  # Track previous abnormality for jump detection
 
     def start_monitoring(self):
@@ -135,12 +411,13 @@ class HealthMonitor:
         continuous monitoring loop that only exits when:
         - User types REMOVE command (+ PIN if enabled)
         - User presses CTRL+C
+        - Input is closed (CTRL+D, or end of piped input) between cycles
         - Fatal system error occurs
 
         The monitoring flow:
         1. Display configuration summary and instructions
         2. Wait for user confirmation to begin
-        3. Enter monitoring loop (calls _monitoring_loop)
+        3. Run the monitoring loop coroutine (_monitoring_loop) with asyncio
         4. On CTRL+C: perform final safety check
         5. Clean exit
 
@@ -157,11 +434,12 @@ class HealthMonitor:
         cycle_count = 1
 
         UI.header("🛡️  SAFETY MONITORING ACTIVE 🛡️", Colors.BRIGHT_GREEN)
+        low = self.ADAPTIVE_THRESHOLD_RANGE[0]
 
         # Show monitoring info
         info_items = [
             f"{Colors.CYAN}Baseline Heart Rate:{Colors.RESET} {self.baseline_heart_rate} bpm",
-            f"{Colors.CYAN}Escalation Threshold:{Colors.RESET} {self.ESCALATION_THRESHOLD}%",
+            f"{Colors.CYAN}Escalation Threshold:{Colors.RESET} {self.ESCALATION_THRESHOLD}% (adapts down to {low}%)",
             f"{Colors.CYAN}Sharp Jump Threshold:{Colors.RESET} >{self.SHARP_JUMP_THRESHOLD}%",
         ]
 
@@ -174,147 +452,55 @@ class HealthMonitor:
 
         UI.status_box("MONITORING SETTINGS", info_items)
 
-        print(f"{Colors.CYAN}📱 To end monitoring:{Colors.RESET}")
-        print(f"   • Type {Colors.BOLD}REMOVE{Colors.RESET} or {Colors.BOLD}REMOVED{Colors.RESET} (+ PIN if enabled) after any cycle")
-        print(f"   • Or press {Colors.BOLD}CTRL+C{Colors.RESET} anytime")
-        print(f"\n{Colors.GREEN}System will perform a final safety check before ending.{Colors.RESET}\n")
+        print(_END_MONITORING_HELP)
 
-        input(f"{Colors.BOLD}Press Enter to begin monitoring...{Colors.RESET}")
+        console_input.read_line(f"{Colors.BOLD}Press Enter to begin monitoring...{Colors.RESET}")
 
+        # asyncio.run() turns CTRL+C into cancellation of the running
+        # coroutine, so pending waits are unregistered before we get here
         try:
-            self._monitoring_loop(cycle_count)
+            asyncio.run(self._monitoring_loop(cycle_count))
         except KeyboardInterrupt:
+            self._flush_output()
             print(f"\n\n{Colors.BRIGHT_RED}🔴 Watch removal detected (CTRL+C pressed)...{Colors.RESET}")
-            self._final_safety_check()
+            asyncio.run(self._final_safety_check())
 
-    def _monitoring_loop(self, cycle_count):
+    async def _monitoring_loop(self, cycle_count):
         """Main monitoring loop"""
+        # Each cycle's output is collected in self._out and written to
+        # stdout in one call before any prompt or wait
+        out = self._out
         while True:
-            UI.cycle_header(cycle_count)
-
-            # Collect sensor reading
-            reading = SensorSimulator.generate_reading()
-            self.last_five_readings.append(reading)
-            if len(self.last_five_readings) > 5:
-                self.last_five_readings.pop(0)
-
-            # First 4 cycles: only collecting data, abnormality is always 0
-            if cycle_count <= 4:
-                print(f"{Colors.YELLOW}📊 Collecting initial data... ({cycle_count}/4){Colors.RESET}")
-                UI.progress_bar(cycle_count, 4)
-                print(f"\n{Colors.CYAN}Heart Rate:{Colors.RESET} {Colors.BOLD}{reading.heart_rate} bpm{Colors.RESET}")
-                print(f"{Colors.CYAN}Motion:{Colors.RESET} {'🏃 Detected' if reading.motion_detected else '🧍 Not Detected'}")
-                print(f"{Colors.GREEN}Abnormality: 0%{Colors.RESET}")
+            UI.cycle_header(cycle_count, file=out)
+
+            # Collect this cycle's sensor samples; the latest one is displayed
+            heart_rates, motions = self.simulator.generate_batch(self.SAMPLES_PER_CYCLE)
+            self._push_samples(heart_rates, motions)
+            heart_rate, motion_detected = heart_rates[-1], motions[-1]
+
+            # Until the window is full: only collecting data, nothing is
+            # scored and abnormality is always 0
+            if self._filled < WINDOW_SIZE:
+                print(_COLLECTING_PREFIX, self._filled, _COLLECTING_SUFFIX, sep="", file=out)
+                UI.progress_bar(self._filled, WINDOW_SIZE, file=out)
+                print("\n", _HR_PREFIX, heart_rate, _HR_SUFFIX, sep="", file=out)
+                print(_MOTION_LINES[motion_detected], file=out)
+                print(_WARMUP_ABNORMALITY, file=out)
             else:
-                # Calculate abnormality percentage (from cycle 5 onwards using current + previous 4)
-                abnormality = self._calculate_abnormality(self.last_five_readings)
+                # Calculate abnormality percentage over the full window
+                abnormality = self._calculate_abnormality()
 
-                print(f"{Colors.CYAN}Heart Rate:{Colors.RESET} {Colors.BOLD}{reading.heart_rate} bpm{Colors.RESET}")
-                print(f"{Colors.CYAN}Motion:{Colors.RESET} {'🏃 Detected' if reading.motion_detected else '🧍 Not Detected'}")
+                print(_HR_PREFIX, heart_rate, _HR_SUFFIX, sep="", file=out)
+                print(_MOTION_LINES[motion_detected], file=out)
 
                 # Show abnormality gauge
-                UI.abnormality_gauge(abnormality)
-
-                # Check if we need to ask user again due to previous no response
-                if self.awaiting_user_response:
-                    print("\n⚠️  Previous cycle had no response - checking again...")
-                    safe = self._prompt_user_safety()
-
-                    if safe:
-                        print("✓ User confirmed safety.")
-                        if self.alert_sent:
-                            print("📢 Previously an alert was sent to your contacts.")
-                            print("   Please inform them that you are safe.")
-                        # Reset state and return to normal flow
-                        self.awaiting_user_response = False
-                        self.alert_sent = False
-                        self.consecutive_abnormal_after_yes = 0
-                        self.user_previously_said_safe = False
-                    else:
-                        # No response again - send alert again
-                        print("⚠️  No response again - sending alert to emergency contacts!")
-                        self.alert_system.send_alert()
-                        self.alert_sent = True
-                        # Reset and go back to normal flow
-                        self.awaiting_user_response = False
-                        self.consecutive_abnormal_after_yes = 0
-                        self.user_previously_said_safe = False
-
-                # Normal flow - check abnormality level
-                elif abnormality > self.ESCALATION_THRESHOLD:
-                    # Abnormality > 45%
-
-                    # Check if user previously said safe and we're tracking consecutive abnormal
-                    if self.user_previously_said_safe:
-                        print("📝 Note: User previously responded safe")
-
-                        # Check for sharp jump >20% from previous abnormality
-                        sharp_jump_detected = False
-                        if self.last_abnormality is not None:
-                            jump = abnormality - self.last_abnormality
-                            if jump > self.SHARP_JUMP_THRESHOLD:
-                                sharp_jump_detected = True
-                                print(f"⚠️  SHARP JUMP DETECTED: {round(jump)}% increase from previous cycle!")
-                                print("Checking on user immediately...")
-
-                        # Increment AFTER checking for sharp jump
-                        self.consecutive_abnormal_after_yes += 1
-
-                        # Display count for debugging
-                        print(f"   (Consecutive abnormal cycles after 'yes': {self.consecutive_abnormal_after_yes})")
-
-                        # Ask on sharp jump OR after exactly 3 consecutive abnormal cycles
-                        if sharp_jump_detected or self.consecutive_abnormal_after_yes >= 3:
-                            if self.consecutive_abnormal_after_yes >= 3 and not sharp_jump_detected:
-                                print("⚠️  3rd consecutive abnormal cycle after 'yes' - checking on user...")
-
-                            safe = self._prompt_user_safety()
-
-                            if safe:
-                                print("✓ User confirmed safety.")
-                                # Reset tracking and start fresh
-                                self.consecutive_abnormal_after_yes = 0
-                                self.user_previously_said_safe = False
-                            else:
-                                # No response or no
-                                print("⚠️  No response or unsafe - sending alert to emergency contacts!")
-                                self.alert_system.send_alert()
-                                self.awaiting_user_response = True
-                                self.alert_sent = True
-                                self.consecutive_abnormal_after_yes = 0
-                                self.user_previously_said_safe = False
-                        # else: just note it and continue (1st or 2nd consecutive, no sharp jump)
-                    else:
-                        # First time seeing >45% or not tracking consecutive
-                        safe = self._prompt_user_safety()
-
-                        if safe:
-                            print("✓ User confirmed safety.")
-                            # Start tracking consecutive abnormal cycles
-                            # Set counter to 0 - we'll increment on NEXT abnormal cycle
-                            self.user_previously_said_safe = True
-                            self.consecutive_abnormal_after_yes = 0
-                        else:
-                            # No response or no
-                            print("⚠️  No response or unsafe - sending alert to emergency contacts!")
-                            self.alert_system.send_alert()
-                            self.awaiting_user_response = True
-                            self.alert_sent = True
-                            self.user_previously_said_safe = False
+                UI.abnormality_gauge(abnormality, file=out)
 
-                else:
-                    # Abnormality 0-45% (normal)
-                    if self.user_previously_said_safe:
-                        # Check if this breaks the consecutive abnormal pattern
-                        # If we had consecutive abnormal and now it's normal, reset
-                        print("Status: Normal")
-                        # Reset the consecutive counter but we might continue tracking
-                        # Based on spec: "if consecutive cycles are normal or alternately normal and abnormal"
-                        # We reset completely when we get normal readings
-                        self.consecutive_abnormal_after_yes = 0
-                        self.user_previously_said_safe = False
-                    else:
-                        print("Status: Normal - No escalation needed")
+                # Look up what to do this cycle from the transition table
+                action = self._next_action(abnormality)
+                await self._apply_action(action, abnormality)
+                if action == Action.NORMAL:
+                    self._record_normal_score(abnormality)
 
                 # Store current abnormality for next cycle's jump detection
                 self.last_abnormality = abnormality
@@ -322,51 +508,240 @@ class HealthMonitor:
             cycle_count += 1
 
             # Always check if user wants to remove the watch after each cycle
-            print(f"\n{Colors.CYAN}To continue to next cycle or end monitoring:{Colors.RESET}")
+            print(_CONTINUE_HEADER, file=out)
             if self.safety_pin:
-                print(f"  • Press Enter to continue to next cycle in {self.CYCLE_DELAY} seconds")
-                print(f"  • Type 'REMOVE {self.safety_pin}' to end monitoring now")
+                print(f"  • Press Enter to continue to next cycle in {self.CYCLE_DELAY} seconds", file=out)
+                print(f"  • Type 'REMOVE {self.safety_pin}' to end monitoring now", file=out)
             else:
-                print(f"  • Press Enter to continue to next cycle in {self.CYCLE_DELAY} seconds")
-                print(f"  • Type 'REMOVE' to end monitoring now")
-
-            # Non-blocking wait with timeout
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(self.CYCLE_DELAY)
+                print(f"  • Press Enter to continue to next cycle in {self.CYCLE_DELAY} seconds", file=out)
+                print(f"  • Type 'REMOVE' to end monitoring now", file=out)
 
+            # Wait for input with timeout; None means the delay expired
+            self._flush_output()
             try:
-                user_input = input().strip()
-                signal.alarm(0)  # Cancel alarm
+                user_input = await _timed_input(self.CYCLE_DELAY)
 
                 # Parse input for REMOVE command with optional PIN
                 if user_input:
                     parts = user_input.split()
-                    command = parts[0].upper()
-
-                    if command == "REMOVE" or command == "REMOVED":
+                    if parts[0] in _REMOVE_TOKENS:
                         # Check PIN if required
                         if self.safety_pin:
-                            if len(parts) < 2 or parts[1] != self.safety_pin:
-                                print("⚠️  Incorrect or missing PIN - continuing monitoring")
+                            if len(parts) < 2 or not self._pin_matches(parts[1]):
+                                print("⚠️  Incorrect or missing PIN - continuing monitoring", file=out)
                             else:
-                                print("\n🔴 Watch removal detected...")
-                                self._final_safety_check()
+                                print("\n🔴 Watch removal detected...", file=out)
+                                await self._final_safety_check()
                                 return  # Exit monitoring loop
                         else:
-                            print("\n🔴 Watch removal detected...")
-                            self._final_safety_check()
+                            print("\n🔴 Watch removal detected...", file=out)
+                            await self._final_safety_check()
                             return  # Exit monitoring loop
-                # If just Enter or anything else, continue to next cycle
-            except TimeoutError:
-                signal.alarm(0)  # Timeout - continue to next cycle
-                pass
+                # If just Enter, timeout or anything else, continue to next cycle
+            except EOFError:
+                # stdin closed (or CTRL+D): the user can no longer answer
+                # prompts, so end the session through the final check
+                print("\n🔴 Input closed - ending monitoring...", file=out)
+                await self._final_safety_check()
+                return
             except Exception:
-                signal.alarm(0)
                 pass
 
-    def _calculate_abnormality(self, window: List[SensorReading]) -> float:
+    def _next_action(self, abnormality: float) -> Action:
+        """
+        Look up this cycle's action in the transition table.
+
+        Args:
+            abnormality (float): This cycle's abnormality score
+
+        Returns:
+            Action: What _apply_action should do for the current state
+        """
+        sharp_jump = (self.last_abnormality is not None
+                      and abnormality - self.last_abnormality > self.SHARP_JUMP_THRESHOLD)
+        key = (
+            self.state,
+            abnormality > self._escalation_threshold,
+            sharp_jump,
+            self.consecutive_abnormal_after_yes + 1 >= 3,
+        )
+        return _TRANSITIONS[key]
+
+    async def _apply_action(self, action: Action, abnormality: float):
+        """
+        Carry out one state-machine action and update the tracking state.
+
+        Output is written to the per-cycle buffer; prompts and alerts
+        flush it first so everything appears in order.
+
+        Args:
+            action (Action): Action looked up from the transition table
+            abnormality (float): This cycle's abnormality score
+        """
+        out = self._out
+        match action:
+            case Action.RECHECK:
+                # Previous cycle had no response - ask again regardless of level
+                print("\n⚠️  Previous cycle had no response - checking again...", file=out)
+                safe = await self._prompt_user_safety()
+
+                if safe:
+                    print("✓ User confirmed safety.", file=out)
+                    # An alert always went out before entering AWAITING_RESPONSE
+                    print("📢 Previously an alert was sent to your contacts.", file=out)
+                    print("   Please inform them that you are safe.", file=out)
+                else:
+                    # No response again - send alert again
+                    print("⚠️  No response again - sending alert to emergency contacts!", file=out)
+                    await self._alert_contacts()
+                # Either way, go back to normal flow
+                self.state = State.IDLE
+                self.consecutive_abnormal_after_yes = 0
+
+            case Action.PROMPT:
+                # First time seeing >45% or not tracking consecutive
+                safe = await self._prompt_user_safety()
+
+                if safe:
+                    print("✓ User confirmed safety.", file=out)
+                    # Start tracking consecutive abnormal cycles
+                    # Set counter to 0 - we'll increment on NEXT abnormal cycle
+                    self.state = State.PREV_SAFE
+                    self.consecutive_abnormal_after_yes = 0
+                else:
+                    # No response or no
+                    print("⚠️  No response or unsafe - sending alert to emergency contacts!", file=out)
+                    await self._alert_contacts()
+                    self.state = State.AWAITING_RESPONSE
+
+            case Action.NOTE | Action.SHARP_JUMP | Action.THIRD_ABNORMAL:
+                # Abnormal again after the user previously said safe
+                print("📝 Note: User previously responded safe", file=out)
+
+                if action == Action.SHARP_JUMP:
+                    jump = abnormality - self.last_abnormality
+                    print(f"⚠️  SHARP JUMP DETECTED: {round(jump)}% increase from previous cycle!", file=out)
+                    print("Checking on user immediately...", file=out)
+
+                # Increment AFTER checking for sharp jump
+                self.consecutive_abnormal_after_yes += 1
+
+                # Display count for debugging
+                print(f"   (Consecutive abnormal cycles after 'yes': {self.consecutive_abnormal_after_yes})", file=out)
+
+                if action == Action.THIRD_ABNORMAL:
+                    print("⚠️  3rd consecutive abnormal cycle after 'yes' - checking on user...", file=out)
+
+                # NOTE: 1st or 2nd consecutive with no sharp jump - just note it
+                if action != Action.NOTE:
+                    safe = await self._prompt_user_safety()
+
+                    if safe:
+                        print("✓ User confirmed safety.", file=out)
+                        # Reset tracking and start fresh
+                        self.state = State.IDLE
+                    else:
+                        # No response or no
+                        print("⚠️  No response or unsafe - sending alert to emergency contacts!", file=out)
+                        await self._alert_contacts()
+                        self.state = State.AWAITING_RESPONSE
+                    self.consecutive_abnormal_after_yes = 0
+
+            case Action.RESET:
+                # Abnormality 0-45% breaks the consecutive abnormal pattern
+                # Based on spec: "if consecutive cycles are normal or alternately normal and abnormal"
+                # We reset completely when we get normal readings
+                print("Status: Normal", file=out)
+                self.state = State.IDLE
+                self.consecutive_abnormal_after_yes = 0
+
+            case _:
+                print("Status: Normal - No escalation needed", file=out)
+
+    def _record_normal_score(self, abnormality: float):
+        """
+        Add a normal cycle's score to the baseline and refresh the threshold.
+
+        The threshold is recomputed here, once per normal cycle, and stored so
+        the per-cycle escalation check is a plain comparison. The sorted copy
+        of the baseline is updated incrementally (drop the oldest score, insert
+        the new one) rather than re-sorted. A change in the (rounded)
+        threshold is reported in the cycle output.
+
+        Args:
+            abnormality (float): Score of a cycle that needed no escalation
+        """
+        scores = self._baseline_scores
+        ordered = self._baseline_sorted
+        if len(scores) == scores.maxlen:
+            del ordered[bisect_left(ordered, scores[0])]
+        scores.append(abnormality)
+        insort(ordered, abnormality)
+        if len(scores) >= self.BASELINE_MIN_CYCLES:
+            threshold = self._robust_threshold()
+            if round(threshold) != round(self._escalation_threshold):
+                print(f"{Colors.CYAN}📐 Escalation threshold adapted to{Colors.RESET} "
+                      f"{Colors.BOLD}{round(threshold)}%{Colors.RESET}", file=self._out)
+            self._escalation_threshold = threshold
+
+    def _robust_threshold(self) -> float:
+        """
+        Compute the escalation threshold from the user's normal-cycle baseline.
+
+        A score is abnormal when its modified z-score,
+        0.6745 * (score - median) / MAD, exceeds ROBUST_Z_THRESHOLD. Solving
+        for the score gives the threshold returned here. The median and MAD
+        are robust to the occasional spike that slips into the baseline.
+
+        Returns:
+            float: Threshold clamped to ADAPTIVE_THRESHOLD_RANGE
+        """
+        ordered = self._baseline_sorted
+        center = _sorted_median(ordered)
+        mad = max(_sorted_mad(ordered, center), self.MIN_MAD)
+        threshold = center + self.ROBUST_Z_THRESHOLD * mad / 0.6745
+        low, high = self.ADAPTIVE_THRESHOLD_RANGE
+        return min(max(threshold, low), high)
+
+    def _flush_output(self):
+        """Write the buffered cycle output to stdout in one call and clear the buffer"""
+        out = self._out
+        if out.tell():
+            sys.stdout.write(out.getvalue())
+            out.seek(0)
+            out.truncate(0)
+        sys.stdout.flush()
+
+    async def _alert_contacts(self):
+        """Send the emergency alert after flushing any buffered output"""
+        self._flush_output()
+        await self.alert_system.send_alert()
+
+    def _push_samples(self, heart_rates, motions):
+        """
+        Shift a batch of samples into the packed sliding window.
+
+        Each sample shifts the heart-rate lanes up one byte and the motion
+        mask up one bit, dropping the oldest reading off the top. Only the
+        newest WINDOW_SIZE samples can remain in the window, so older ones are
+        skipped.
+
+        Args:
+            heart_rates: Heart rates (bpm), oldest first
+            motions: Motion flags matching heart_rates
+        """
+        hr_lanes = self._hr_lanes
+        motion_bits = self._motion_bits
+        for hr, motion in zip(heart_rates[-WINDOW_SIZE:], motions[-WINDOW_SIZE:]):
+            hr_lanes = (hr_lanes << 8 & _HR_LANES_MASK) | min(hr, 255)
+            motion_bits = (motion_bits << 1 & _MOTION_MASK) | motion
+        self._hr_lanes = hr_lanes
+        self._motion_bits = motion_bits
+        self._filled = min(self._filled + len(heart_rates), WINDOW_SIZE)
+
+    def _calculate_abnormality(self) -> float:
         """
-        Calculate abnormality score from a sliding window of sensor readings.
+        Calculate abnormality score from the sliding window of sensor readings.
 
         This is the core detection algorithm. Abnormality is ONLY flagged when:
         - Heart rate < 50 bpm (bradycardia) OR > 80 bpm (tachycardia)
@@ -384,40 +759,24 @@ class HealthMonitor:
             - HR 45-50 bpm (no motion): +10 points
             - Maximum score: 100 (capped)
 
-        Args:
-            window (List[SensorReading]): Sliding window of 5 recent readings
+        Scores the WINDOW_SIZE most recent readings held in the packed
+        window; only called once the window is full (_filled == WINDOW_SIZE,
+        cycle 5 onwards at one sample per cycle).
 
         Returns:
             float: Abnormality score from 0-100
                   0-45: Normal, no action
                   45+: Escalation threshold, prompts user
+                  (the threshold adapts per user; see _robust_threshold)
 
         Example:
-            >>> readings = [SensorReading(110, False) for _ in range(5)]
-            >>> abnormality = monitor._calculate_abnormality(readings)
+            >>> # Window holds 5 readings of 115 bpm with no motion
+            >>> abnormality = monitor._calculate_abnormality()
             >>> print(abnormality)  # 100 (5 readings × 25 points, capped at 100)
         """
-        score = 0
-        for r in window:
-            hr = r.heart_rate
-            # Only count as abnormal if: (HR < 50 OR HR > 80) AND no motion
-            if not r.motion_detected and (hr < 50 or hr > 80):
-                # Higher deviation = higher score
-                if hr > 110:
-                    score += 25
-                elif hr > 100:
-                    score += 20
-                elif hr > 90:
-                    score += 15
-                elif hr > 80:
-                    score += 10
-                elif hr < 45:
-                    score += 20
-                elif hr < 50:
-                    score += 10
-        return min(100, score)
-
-    def _prompt_user_safety(self) -> bool:
+        return _score_window(self._hr_lanes, self._motion_bits)
+
+    async def _prompt_user_safety(self) -> bool:
         """
         Prompt user for safety confirmation with timeout and PIN validation.
 
@@ -431,8 +790,8 @@ class HealthMonitor:
         - No response: Timeout after 15 seconds, treated as unsafe
 
         Timeout Implementation:
-            Uses UNIX SIGALRM signal for non-blocking input with timeout.
-            On Windows, this may not work (SIGALRM not available).
+            Awaits _timed_input, which watches stdin from the event loop
+            (console polling on Windows), so no signal handler is involved.
 
         Args:
             None (uses instance variables for PIN and timeout settings)
@@ -457,26 +816,25 @@ class HealthMonitor:
                 User doesn't respond within 15s
                 Returns: False (triggers alert)
         """
+        self._flush_output()
         if self.safety_pin:
             print(f"\n🔔 Are you okay? Type 'YES [PIN]' within {self.RESPONSE_TIMEOUT} seconds:")
             print(f"   (or type 'REMOVE [PIN]' to end monitoring)")
         else:
             print(f"\n🔔 Are you okay? Type YES within {self.RESPONSE_TIMEOUT} seconds:")
 
-        # Set up signal handler for timeout
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(self.RESPONSE_TIMEOUT)
-
         try:
-            response = input().strip()
-            signal.alarm(0)  # Cancel the alarm
+            response = await _timed_input(self.RESPONSE_TIMEOUT)
+            if response is None:
+                print("\n⏱️  Time expired - no response received")
+                return False
 
             # Parse response (could be "YES PIN" or "REMOVE PIN" or just "YES"/"REMOVE")
             parts = response.split()
             if not parts:
                 return False
 
-            command = parts[0].upper()
+            command = parts[0]
 
             # Check if PIN is required and validate it
             if self.safety_pin:
@@ -484,29 +842,40 @@ class HealthMonitor:
                     print("⚠️  PIN required but not provided")
                     return False
                 provided_pin = parts[1]
-                if provided_pin != self.safety_pin:
+                if not self._pin_matches(provided_pin):
                     print("⚠️  Incorrect PIN")
                     return False
 
             # Check for REMOVE command
-            if command == "REMOVE" or command == "REMOVED":
+            if command in _REMOVE_TOKENS:
                 print("\n🔴 Watch removal detected...")
-                self._final_safety_check()
+                await self._final_safety_check()
                 raise SystemExit()  # Exit the program
 
-            return command == "YES"
-        except TimeoutError:
-            signal.alarm(0)  # Cancel the alarm
-            print("\n⏱️  Time expired - no response received")
-            return False
+            return command in _YES_TOKENS
         except SystemExit:
             raise  # Re-raise to exit
         except Exception:
-            signal.alarm(0)  # Cancel the alarm
             return False
 
-    def _final_safety_check(self):
+    def _pin_matches(self, provided_pin: str) -> bool:
+        """
+        Check a provided PIN against the configured safety PIN.
+
+        Uses a constant-time comparison so response timing does not reveal
+        how many leading digits of a guess were correct.
+
+        Args:
+            provided_pin (str): PIN typed by the user
+
+        Returns:
+            bool: True if the PIN matches exactly
+        """
+        return hmac.compare_digest(provided_pin.encode(), self._safety_pin_bytes)
+
+    async def _final_safety_check(self):
         """Always ask user if they're safe before terminating, regardless of abnormality"""
+        self._flush_output()
         print("\n" + "="*60)
         print("FINAL SAFETY CHECK BEFORE ENDING SESSION")
         print("="*60)
@@ -516,40 +885,34 @@ class HealthMonitor:
         else:
             print(f"Are you safe? Type 'YES' within {self.RESPONSE_TIMEOUT} seconds:")
 
-        # Set up signal handler for timeout
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(self.RESPONSE_TIMEOUT)
-
         try:
-            response = input().strip()
-            signal.alarm(0)  # Cancel the alarm
+            response = await _timed_input(self.RESPONSE_TIMEOUT)
+            if response is None:
+                print("\n⚠️  No response - sending alert to emergency contacts!")
+                await self._alert_contacts()
+                print("Monitoring session ended.")
+                return
 
             # Parse response for YES command with optional PIN
             parts = response.split()
-            if parts and parts[0].upper() == "YES":
+            if parts and parts[0] in _YES_TOKENS:
                 # Check PIN if required
                 if self.safety_pin:
-                    if len(parts) >= 2 and parts[1] == self.safety_pin:
+                    if len(parts) >= 2 and self._pin_matches(parts[1]):
                         print("\n✓ User confirmed safety.")
                         print("Monitoring session ended. Stay safe!")
                     else:
                         print("\n⚠️  Incorrect or missing PIN - treating as unsafe!")
-                        self.alert_system.send_alert()
+                        await self._alert_contacts()
                         print("Monitoring session ended.")
                 else:
                     print("\n✓ User confirmed safety.")
                     print("Monitoring session ended. Stay safe!")
             else:
                 print("\n⚠️  Unsafe response - sending alert to emergency contacts!")
-                self.alert_system.send_alert()
+                await self._alert_contacts()
                 print("Monitoring session ended.")
-        except TimeoutError:
-            signal.alarm(0)  # Cancel the alarm
-            print("\n⚠️  No response - sending alert to emergency contacts!")
-            self.alert_system.send_alert()
-            print("Monitoring session ended.")
         except Exception:
-            signal.alarm(0)  # Cancel the alarm
             print("\n⚠️  Error - sending alert to emergency contacts as precaution!")
-            self.alert_system.send_alert()
+            await self._alert_contacts()
             print("Monitoring session ended.")
@@ -6,7 +6,8 @@ monitoring system. It collects baseline heart rate and optional PIN
 protection before starting continuous health monitoring.
 """
 
-from health_monitor import HealthMonitor
+import console_input
+from baseline_data import BASELINE_HEART_RATE
 from ui_utils import UI, Colors
 
 
@@ -49,9 +50,9 @@ def main():
 
     while True:
         try:
-            baseline_hr = input(f"{Colors.BOLD}Enter your usual resting heart rate (bpm) {Colors.YELLOW}[default: 75]{Colors.RESET}: ").strip()
+            baseline_hr = console_input.read_line(f"{Colors.BOLD}Enter your usual resting heart rate (bpm) {Colors.YELLOW}[default: {BASELINE_HEART_RATE}]{Colors.RESET}: ").strip()
             if baseline_hr == "":
-                baseline_hr = 75
+                baseline_hr = BASELINE_HEART_RATE
                 break
             else:
                 baseline_hr = int(baseline_hr)
@@ -71,7 +72,7 @@ def main():
     print(f"{Colors.CYAN}A PIN prevents others from responding 'YES' or removing the watch")
     print(f"without your knowledge, providing an extra layer of security.{Colors.RESET}\n")
 
-    safety_pin = input(f"{Colors.BOLD}Enter a 4-6 digit PIN {Colors.YELLOW}[or press Enter to skip]{Colors.RESET}: ").strip()
+    safety_pin = console_input.read_line(f"{Colors.BOLD}Enter a 4-6 digit PIN {Colors.YELLOW}[or press Enter to skip]{Colors.RESET}: ").strip()
 
     if safety_pin:
         if len(safety_pin) < 4 or len(safety_pin) > 6:
@@ -79,7 +80,7 @@ def main():
             safety_pin = ""
         else:
             # Confirm PIN
-            confirm_pin = input(f"{Colors.BOLD}Confirm PIN:{Colors.RESET} ").strip()
+            confirm_pin = console_input.read_line(f"{Colors.BOLD}Confirm PIN:{Colors.RESET} ").strip()
             if confirm_pin != safety_pin:
                 UI.warning("PINs don't match. Using no PIN for this session.")
                 safety_pin = ""
@@ -100,7 +101,10 @@ def main():
     print(f"  • Preferred notification methods")
     print(f"  • Sensitivity settings{Colors.RESET}\n")
 
-    # Start monitoring
+    # Start monitoring. The engine (and asyncio with it) is imported only
+    # now, so the welcome screen and setup prompts don't wait on it
+    from health_monitor import HealthMonitor
+
     monitor = HealthMonitor(baseline_heart_rate=baseline_hr, safety_pin=safety_pin)
     monitor.start_monitoring()
 
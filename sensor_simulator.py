@@ -7,8 +7,38 @@ actual sensor data from smartwatch hardware (heart rate monitor, accelerometer).
 """
 
 import random
+from bisect import bisect
+from itertools import accumulate
+from typing import List, Optional, Tuple
 from sensor_reading import SensorReading
 
+# Heart-rate distribution as a lookup table: band probabilities and bpm
+# ranges. One uniform draw is bisected into the cumulative probabilities to
+# pick a band (what random.choices does with weights), instead of nested ifs
+_HR_WEIGHTS = (0.4, 0.3, 0.3)
+_HR_RANGES = (
+    (50, 80),   # 40% normal resting heart rate range
+    (80, 130),  # 30% tachycardia - many drink spiking substances raise HR
+    (40, 50),   # 30% bradycardia - some sedatives/depressants lower HR
+)
+_HR_CDF = tuple(accumulate(_HR_WEIGHTS))[:-1]  # band boundaries in [0, 1)
+# Per band: (where it starts in the CDF, bpm per unit of probability, low, high)
+_HR_BANDS = tuple(
+    (start, (high - low + 1) / (end - start), low, high)
+    for start, end, (low, high) in zip((0.0,) + _HR_CDF, _HR_CDF + (1.0,), _HR_RANGES)
+)
+
+
+def _heart_rate_from_uniform(u: float) -> int:
+    """
+    Map one uniform draw in [0, 1) to a simulated heart rate.
+
+    The draw picks the band through the CDF, and its position inside that
+    band's slice of [0, 1) picks the bpm, so no second draw is needed.
+    """
+    start, scale, low, high = _HR_BANDS[bisect(_HR_CDF, u)]
+    return min(low + int((u - start) * scale), high)  # min() guards float rounding
+
 
 class SensorSimulator:
     """
@@ -31,10 +61,66 @@ class SensorSimulator:
         - Fitbit Web API
         - Generic Bluetooth LE heart rate monitor
         - Smartwatch accelerometer data
+
+    Each simulator draws from its own random.Random stream, so several
+    simulated sensors can run side by side without sharing (or contending
+    for) the global random state. Use spawn() to create independent ones.
     """
 
-    @staticmethod
-    def generate_reading() -> SensorReading:
+    __slots__ = ('_rng',)
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initialize a simulator.
+
+        Args:
+            rng (random.Random, optional): Generator to draw readings from.
+                                           Defaults to a new, entropy-seeded one.
+        """
+        self._rng = rng if rng is not None else random.Random()
+
+    @classmethod
+    def spawn(cls, n: int, seed=None) -> List["SensorSimulator"]:
+        """
+        Create n simulators with independent, reproducible random streams.
+
+        Each child generator is seeded from the string "<seed>:<index>",
+        which random.Random hashes with SHA-512, so the children's seeds are
+        unrelated even for adjacent indices.
+
+        Args:
+            n (int): Number of simulators to create
+            seed (int, optional): Root seed; the same root always yields the
+                                  same streams. None draws one from system entropy.
+
+        Returns:
+            List[SensorSimulator]: n simulators with separate generators
+
+        Example:
+            >>> left, right = SensorSimulator.spawn(2, seed=7)
+            >>> left.generate_batch(3) != right.generate_batch(3)
+            True
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(128)
+        return [cls(random.Random(f"{seed}:{index}")) for index in range(n)]
+
+    def seed(self, seed=None):
+        """
+        Reseed the simulator's random generator.
+
+        Args:
+            seed (int, optional): Seed for a reproducible sequence of readings.
+                                  None reseeds from system entropy.
+
+        Example:
+            >>> simulator = SensorSimulator()
+            >>> simulator.seed(42)
+            >>> simulator.generate_batch(3)  # same readings on every run
+        """
+        self._rng.seed(seed)
+
+    def generate_reading(self) -> SensorReading:
         """
         Generate a single simulated sensor reading.
 
@@ -55,28 +141,49 @@ class SensorSimulator:
                           and motion detection status
 
         Example:
-            >>> reading = SensorSimulator.generate_reading()
+            >>> reading = SensorSimulator().generate_reading()
             >>> print(f"HR: {reading.heart_rate}, Motion: {reading.motion_detected}")
             HR: 95, Motion: False
         """
+        heart_rate, motion = self._sample()
+        return SensorReading(heart_rate, motion)
+
+    def generate_batch(self, n: int) -> Tuple[List[int], List[bool]]:
+        """
+        Generate n simulated sensor readings in one call.
+
+        Real wearables sample heart rate and motion many times per
+        monitoring cycle; this returns a whole batch as two parallel lists
+        so callers can ingest it without creating a SensorReading per
+        sample. Readings follow the same distribution as generate_reading(),
+        but each list is drawn in a single comprehension with the random
+        generator bound locally, rather than one _sample() call per reading.
+
+        Args:
+            n (int): Number of readings to generate
+
+        Returns:
+            Tuple[List[int], List[bool]]: Heart rates (bpm) and motion flags,
+                                          oldest reading first
+
+        Example:
+            >>> heart_rates, motions = SensorSimulator().generate_batch(3)
+            >>> print(heart_rates, motions)
+            [72, 118, 44] [False, True, False]
+        """
+        rand = self._rng.random
+        motions = [rand() > 0.6 for _ in range(n)]
+        heart_rates = [_heart_rate_from_uniform(rand()) for _ in range(n)]
+        return heart_rates, motions
+
+    def _sample(self) -> Tuple[int, bool]:
+        """Draw one (heart_rate, motion_detected) pair from the simulated distribution"""
         # 60% chance of no motion (realistic for sitting at bar/table)
         # Abnormality detection only triggers when stationary + abnormal HR
-        motion = random.random() > 0.6
+        motion = self._rng.random() > 0.6
 
-        # Generate heart rate with weighted distribution
+        # Generate heart rate with weighted distribution (see _HR_RANGES)
         # 40% normal range (50-80 bpm), 60% potentially abnormal
-        if random.random() < 0.4:
-            # Normal resting heart rate range
-            heart_rate = random.randint(50, 80)
-        else:
-            # Potentially abnormal - either low or high
-            if random.random() < 0.5:
-                # High heart rate - tachycardia
-                # Many drink spiking substances cause elevated heart rate
-                heart_rate = random.randint(80, 130)
-            else:
-                # Low heart rate - bradycardia
-                # Some sedatives/depressants cause reduced heart rate
-                heart_rate = random.randint(40, 50)
+        heart_rate = _heart_rate_from_uniform(self._rng.random())
 
-        return SensorReading(heart_rate, motion)
+        return heart_rate, motion
@@ -0,0 +1,87 @@
+"""
+Unit checks for the adaptive escalation threshold in health_monitor.
+
+Covers the sorted-sequence statistics (_sorted_median, _sorted_mad), the
+robust threshold and its clamp, and how _record_normal_score maintains the
+baseline and reports threshold changes.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import os
+import random
+import statistics
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from health_monitor import HealthMonitor, _sorted_mad, _sorted_median
+
+
+class SortedStatisticsTest(unittest.TestCase):
+    def test_median_matches_statistics_module(self):
+        for values in ([7], [1, 3], [0, 5, 5, 20], [0, 0, 10, 15, 40]):
+            self.assertEqual(_sorted_median(values), statistics.median(values))
+
+    def test_mad_matches_brute_force(self):
+        rng = random.Random(7)
+        for size in range(1, 40):
+            values = sorted(rng.choice(range(0, 101, 5)) for _ in range(size))
+            center = statistics.median(values)
+            expected = statistics.median(abs(v - center) for v in values)
+            self.assertEqual(_sorted_mad(values, center), expected, values)
+
+
+class RobustThresholdTest(unittest.TestCase):
+    def setUp(self):
+        self.monitor = HealthMonitor()
+
+    def threshold_for(self, scores):
+        self.monitor._baseline_sorted = sorted(scores)
+        return self.monitor._robust_threshold()
+
+    def test_median_plus_scaled_mad(self):
+        # median 10, MAD 5: 10 + 3.5 * 5 / 0.6745
+        self.assertAlmostEqual(self.threshold_for([5, 10, 15] * 6), 10 + 3.5 * 5 / 0.6745)
+
+    def test_flat_baseline_uses_mad_floor_and_lower_bound(self):
+        # MAD floored at MIN_MAD gives ~25.9, below the 30% lower bound
+        self.assertEqual(self.threshold_for([0] * 20), 30)
+
+    def test_never_above_fixed_threshold(self):
+        # A noisy baseline would put the threshold far above 45%
+        self.assertEqual(self.threshold_for([0, 20, 40] * 6), HealthMonitor.ESCALATION_THRESHOLD)
+        low, high = HealthMonitor.ADAPTIVE_THRESHOLD_RANGE
+        self.assertEqual((low, high), (30, HealthMonitor.ESCALATION_THRESHOLD))
+
+
+class RecordNormalScoreTest(unittest.TestCase):
+    def setUp(self):
+        self.monitor = HealthMonitor()
+
+    def test_fixed_threshold_until_enough_cycles(self):
+        for _ in range(HealthMonitor.BASELINE_MIN_CYCLES - 1):
+            self.monitor._record_normal_score(0)
+        self.assertEqual(self.monitor._escalation_threshold, HealthMonitor.ESCALATION_THRESHOLD)
+        self.monitor._record_normal_score(0)
+        self.assertEqual(self.monitor._escalation_threshold, 30)
+
+    def test_threshold_change_is_reported_once(self):
+        for _ in range(HealthMonitor.BASELINE_MIN_CYCLES + 5):
+            self.monitor._record_normal_score(0)
+        output = self.monitor._out.getvalue()
+        self.assertEqual(output.count("Escalation threshold adapted to"), 1)
+        self.assertIn("30%", output)
+
+    def test_sorted_copy_tracks_window(self):
+        rng = random.Random(3)
+        for _ in range(HealthMonitor.BASELINE_WINDOW * 3):
+            self.monitor._record_normal_score(rng.choice(range(0, 46, 5)))
+            self.assertEqual(self.monitor._baseline_sorted, sorted(self.monitor._baseline_scores))
+        self.assertEqual(len(self.monitor._baseline_scores), HealthMonitor.BASELINE_WINDOW)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Checks for the safety state machine: the _TRANSITIONS table and the
+actions HealthMonitor._apply_action carries out for each entry.
+
+The user's answers and the alerts are scripted by a HealthMonitor
+subclass, so no stdin or alert output is involved.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from itertools import product
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from health_monitor import _TRANSITIONS, Action, HealthMonitor, State
+
+
+class ScriptedMonitor(HealthMonitor):
+    """HealthMonitor whose safety prompts return scripted answers"""
+
+    def __init__(self, answers=()):
+        super().__init__()
+        self.answers = list(answers)
+        self.prompts = 0
+        self.alerts = 0
+
+    async def _prompt_user_safety(self) -> bool:
+        self.prompts += 1
+        return self.answers.pop(0)
+
+    async def _alert_contacts(self):
+        self.alerts += 1
+
+    def apply(self, action, abnormality=50):
+        asyncio.run(self._apply_action(action, abnormality))
+
+    def step(self, abnormality):
+        """Handle one scored cycle as _monitoring_loop does and return its action"""
+        action = self._next_action(abnormality)
+        self.apply(action, abnormality)
+        self.last_abnormality = abnormality
+        return action
+
+
+class TransitionTableTest(unittest.TestCase):
+    def test_every_key_has_an_action(self):
+        keys = set(product(State, (False, True), (False, True), (False, True)))
+        self.assertEqual(set(_TRANSITIONS), keys)
+
+    def test_table_entries(self):
+        for (state, over, jump, third), action in _TRANSITIONS.items():
+            if state == State.AWAITING_RESPONSE:
+                expected = Action.RECHECK
+            elif not over:
+                expected = Action.RESET if state == State.PREV_SAFE else Action.NORMAL
+            elif state == State.IDLE:
+                expected = Action.PROMPT
+            elif jump:
+                expected = Action.SHARP_JUMP  # a sharp jump wins over a 3rd abnormal
+            elif third:
+                expected = Action.THIRD_ABNORMAL
+            else:
+                expected = Action.NOTE
+            self.assertEqual(action, expected, (state, over, jump, third))
+
+
+def confirmed_output(action):
+    """Cycle output of one confirmed action taken after a 'yes'"""
+    monitor = ScriptedMonitor([True])
+    monitor.state = State.PREV_SAFE
+    monitor.last_abnormality = 25
+    monitor.apply(action)
+    return monitor._out.getvalue()
+
+
+class ApplyActionTest(unittest.TestCase):
+    def test_prompt_confirmed_starts_tracking(self):
+        monitor = ScriptedMonitor([True])
+        monitor.apply(Action.PROMPT)
+        self.assertEqual((monitor.state, monitor.consecutive_abnormal_after_yes), (State.PREV_SAFE, 0))
+        self.assertEqual(monitor.alerts, 0)
+
+    def test_prompt_unanswered_alerts_and_awaits_response(self):
+        monitor = ScriptedMonitor([False])
+        monitor.apply(Action.PROMPT)
+        self.assertEqual(monitor.state, State.AWAITING_RESPONSE)
+        self.assertEqual(monitor.alerts, 1)
+
+    def test_recheck_returns_to_idle_either_way(self):
+        for answer, alerts in ((True, 0), (False, 1)):
+            monitor = ScriptedMonitor([answer])
+            monitor.state = State.AWAITING_RESPONSE
+            monitor.apply(Action.RECHECK, abnormality=10)
+            self.assertEqual(monitor.state, State.IDLE)
+            self.assertEqual(monitor.alerts, alerts)
+            self.assertEqual(monitor.prompts, 1)
+
+    def test_note_counts_without_prompting(self):
+        monitor = ScriptedMonitor()
+        monitor.state = State.PREV_SAFE
+        monitor.apply(Action.NOTE)
+        self.assertEqual((monitor.state, monitor.consecutive_abnormal_after_yes), (State.PREV_SAFE, 1))
+        self.assertEqual(monitor.prompts, 0)
+
+    def test_sharp_jump_and_third_abnormal_prompt_and_reset_counter(self):
+        for action in (Action.SHARP_JUMP, Action.THIRD_ABNORMAL):
+            for answer, state, alerts in ((True, State.IDLE, 0), (False, State.AWAITING_RESPONSE, 1)):
+                monitor = ScriptedMonitor([answer])
+                monitor.state = State.PREV_SAFE
+                monitor.consecutive_abnormal_after_yes = 2
+                monitor.last_abnormality = 25
+                monitor.apply(action)
+                self.assertEqual(monitor.state, state, (action, answer))
+                self.assertEqual(monitor.consecutive_abnormal_after_yes, 0)
+                self.assertEqual(monitor.alerts, alerts)
+        self.assertIn("SHARP JUMP DETECTED: 25%", confirmed_output(Action.SHARP_JUMP))
+        self.assertIn("3rd consecutive abnormal", confirmed_output(Action.THIRD_ABNORMAL))
+
+    def test_reset_clears_tracking(self):
+        monitor = ScriptedMonitor()
+        monitor.state = State.PREV_SAFE
+        monitor.consecutive_abnormal_after_yes = 2
+        monitor.apply(Action.RESET, abnormality=10)
+        self.assertEqual((monitor.state, monitor.consecutive_abnormal_after_yes), (State.IDLE, 0))
+        self.assertEqual(monitor.prompts, 0)
+
+
+class CycleSequenceTest(unittest.TestCase):
+    def test_scripted_session(self):
+        # (abnormality, expected action, answer if the action prompts)
+        cycles = [
+            (50, Action.PROMPT, True),
+            (50, Action.NOTE, None),
+            (50, Action.NOTE, None),
+            (50, Action.THIRD_ABNORMAL, True),
+            (50, Action.PROMPT, False),
+            (10, Action.RECHECK, True),
+            (50, Action.PROMPT, True),
+            (75, Action.SHARP_JUMP, False),
+            (10, Action.RECHECK, False),
+            (50, Action.PROMPT, True),
+            (10, Action.RESET, None),
+            (10, Action.NORMAL, None),
+        ]
+        monitor = ScriptedMonitor([answer for _, _, answer in cycles if answer is not None])
+        actions = [monitor.step(abnormality) for abnormality, _, _ in cycles]
+        self.assertEqual(actions, [action for _, action, _ in cycles])
+        self.assertEqual(monitor.alerts, 3)
+        self.assertEqual(monitor.answers, [])
+        self.assertEqual((monitor.state, monitor.consecutive_abnormal_after_yes), (State.IDLE, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
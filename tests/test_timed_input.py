@@ -0,0 +1,136 @@
+"""
+Regression checks for _timed_input and the end-of-file handling around it.
+
+Each check runs a child process so its stdin can be a real pipe or terminal:
+    - Several lines arriving at once are returned one per call, straight
+      away; before console_input existed, the lines after the first were
+      stuck in a stdin buffer and each call waited out its timeout.
+    - CTRL+D on a terminal fails one read only, as with input(); the next
+      prompt waits for the user again instead of failing at once forever.
+    - Closed stdin ends the monitoring loop through the final safety check
+      rather than spinning through cycles and alerts.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import asyncio, time
+from health_monitor import _timed_input
+
+async def main():
+    for _ in range(3):
+        start = time.monotonic()
+        line = await _timed_input(5)
+        print(repr(line), round(time.monotonic() - start, 2), flush=True)
+
+asyncio.run(main())
+"""
+
+CTRL_D_CHILD = """
+import asyncio, time
+from health_monitor import _timed_input
+
+async def main():
+    try:
+        print(repr(await _timed_input(5)), flush=True)
+    except EOFError:
+        print("EOFError", flush=True)
+    start = time.monotonic()
+    try:
+        line = await _timed_input(0.5)
+    except EOFError:
+        line = "EOFError"
+    print(repr(line), round(time.monotonic() - start, 2), flush=True)
+
+asyncio.run(main())
+"""
+
+CLOSED_STDIN_CHILD = """
+import asyncio
+from health_monitor import HealthMonitor
+
+asyncio.run(HealthMonitor()._monitoring_loop(1))
+"""
+
+
+@unittest.skipIf(sys.platform == "win32", "Windows prompts poll the console, not a pipe")
+class TimedInputPipeTest(unittest.TestCase):
+    def test_each_call_returns_next_buffered_line(self):
+        child = subprocess.Popen(
+            [sys.executable, "-c", CHILD],
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            # All three lines in one write; the pipe stays open afterwards
+            child.stdin.write("yes\nno\nYES\n")
+            child.stdin.flush()
+            results = [child.stdout.readline().split() for _ in range(3)]
+        finally:
+            child.stdin.close()
+            child.wait(timeout=10)
+            child.stdout.close()
+
+        self.assertEqual([r[0] for r in results], ["'yes'", "'no'", "'YES'"])
+        for _, elapsed in results:
+            self.assertLess(float(elapsed), 1.0)
+
+    def test_closed_stdin_ends_monitoring(self):
+        child = subprocess.run(
+            [sys.executable, "-c", CLOSED_STDIN_CHILD],
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        self.assertIn("Input closed", child.stdout)
+        self.assertIn("FINAL SAFETY CHECK", child.stdout)
+        # One precautionary alert from the final check, then the loop returns
+        self.assertEqual(child.stdout.count("EMERGENCY ALERT"), 1)
+        self.assertEqual(child.stdout.count("CYCLE 2"), 0)
+
+
+@unittest.skipIf(sys.platform == "win32", "no pseudo-terminals on Windows")
+class TimedInputTerminalTest(unittest.TestCase):
+    def test_ctrl_d_fails_only_one_read(self):
+        import pty
+
+        master, slave = pty.openpty()
+        try:
+            child = subprocess.Popen(
+                [sys.executable, "-c", CTRL_D_CHILD],
+                cwd=PROJECT_ROOT,
+                stdin=slave,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            os.write(master, b"\x04")  # CTRL+D at the start of a line
+            try:
+                first = child.stdout.readline().strip()
+                second = child.stdout.readline().split()
+            finally:
+                child.wait(timeout=10)
+                child.stdout.close()
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        self.assertEqual(first, "EOFError")
+        # The next prompt waits out its timeout like input() would block again
+        self.assertEqual(second[0], "None")
+        self.assertGreaterEqual(float(second[1]), 0.4)
+
+
+if __name__ == "__main__":
+    unittest.main()
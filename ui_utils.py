@@ -2,6 +2,15 @@
 UI Utilities for enhanced terminal display with colors and formatting
 """
 
+import re
+import sys
+from bisect import bisect
+from functools import lru_cache
+
+# 60-column "!" rule and centered title used by the emergency alert banner
+BANG_BAR_60 = "!" * 60
+ALERT_HEADER_60 = "  🚨  EMERGENCY ALERT SENT TO PRE-SAVED CONTACTS  🚨  ".center(60)
+
 class Colors:
     """ANSI color codes for terminal output"""
     # Basic colors
@@ -33,100 +42,155 @@ class Colors:
     BG_YELLOW = '\033[43m'
 
 
+# Color codes and message prefixes resolved once, so the helpers below read
+# module globals instead of looking up Colors attributes on every call
+_BOLD, _RESET = Colors.BOLD, Colors.RESET
+_SUCCESS_PREFIX = f"{Colors.BRIGHT_GREEN}✓ "
+_WARNING_PREFIX = f"{Colors.BRIGHT_YELLOW}⚠️  "
+_ERROR_PREFIX = f"{Colors.BRIGHT_RED}✗ "
+_ALERT_PREFIX = f"\n{Colors.BG_RED}{Colors.WHITE}{Colors.BOLD} 🚨 "
+_INFO_COLOR = Colors.CYAN
+_PROGRESS_COLOR = Colors.CYAN
+
+# Matches any ANSI SGR escape (color/style code), for measuring visible width
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# Static borders and bar fills, built once at import instead of by string
+# multiplication on every call
+_HEADER_RULE = "=" * 60
+_SUBHEADER_RULE = "─" * 60
+_BOX_TOP = f"┌{'─' * 58}┐"
+_BOX_DIVIDER = f"├{'─' * 58}┤"
+_BOX_BOTTOM = f"└{'─' * 58}┘"
+_CYCLE_TOP = f"╔{'═' * 58}╗"
+_CYCLE_BOTTOM = f"╚{'═' * 58}╝"
+# Gauge bar bodies indexed by the number of filled cells
+_GAUGE_FILLS = tuple('█' * i + '░' * (50 - i) for i in range(51))  # 50 chars = 100%
+# Gauge severity buckets: a level below _GAUGE_THRESHOLDS[i] (and at or above
+# the previous one) gets _GAUGE_STATES[i]
+_GAUGE_THRESHOLDS = (30, 45, 70)
+_GAUGE_STATES = (
+    (Colors.BRIGHT_GREEN, "NORMAL"),
+    (Colors.YELLOW, "ELEVATED"),
+    (Colors.BRIGHT_YELLOW, "HIGH"),
+    (Colors.BRIGHT_RED, "CRITICAL"),
+)
+
+
+def _write(text: str, file=None):
+    """Write fully rendered text to file (sys.stdout by default) in one call"""
+    (sys.stdout if file is None else file).write(text)
+
+
 class UI:
-    """Helper functions for pretty terminal output"""
+    """
+    Helper functions for pretty terminal output.
+
+    Every helper accepts an optional ``file`` argument (defaults to
+    sys.stdout) so callers can render into an in-memory buffer and emit
+    several components with a single write. Each helper renders its whole
+    component first and hands it to the stream in one write() call.
+    """
 
     @staticmethod
-    def header(text: str, color=Colors.CYAN):
+    def header(text: str, color=Colors.CYAN, file=None):
         """Print a header with border"""
-        border = "=" * 60
-        print(f"\n{color}{Colors.BOLD}{border}")
-        print(f"{text.center(60)}")
-        print(f"{border}{Colors.RESET}\n")
+        _write(f"\n{color}{_BOLD}{_HEADER_RULE}\n"
+               f"{text.center(60)}\n"
+               f"{_HEADER_RULE}{_RESET}\n\n", file)
 
     @staticmethod
-    def subheader(text: str, color=Colors.BLUE):
+    def subheader(text: str, color=Colors.BLUE, file=None):
         """Print a subheader"""
-        print(f"\n{color}{Colors.BOLD}{'─' * 60}")
-        print(f"{text}")
-        print(f"{'─' * 60}{Colors.RESET}\n")
+        _write(f"\n{color}{_BOLD}{_SUBHEADER_RULE}\n"
+               f"{text}\n"
+               f"{_SUBHEADER_RULE}{_RESET}\n\n", file)
 
     @staticmethod
-    def success(text: str):
+    def success(text: str, file=None):
         """Print success message"""
-        print(f"{Colors.BRIGHT_GREEN}✓ {text}{Colors.RESET}")
+        _write(f"{_SUCCESS_PREFIX}{text}{_RESET}\n", file)
 
     @staticmethod
-    def warning(text: str):
+    def warning(text: str, file=None):
         """Print warning message"""
-        print(f"{Colors.BRIGHT_YELLOW}⚠️  {text}{Colors.RESET}")
+        _write(f"{_WARNING_PREFIX}{text}{_RESET}\n", file)
 
     @staticmethod
-    def error(text: str):
+    def error(text: str, file=None):
         """Print error message"""
-        print(f"{Colors.BRIGHT_RED}✗ {text}{Colors.RESET}")
+        _write(f"{_ERROR_PREFIX}{text}{_RESET}\n", file)
 
     @staticmethod
-    def alert(text: str):
+    def alert(text: str, file=None):
         """Print alert message with red background"""
-        print(f"\n{Colors.BG_RED}{Colors.WHITE}{Colors.BOLD} 🚨 {text} 🚨 {Colors.RESET}\n")
+        _write(f"{_ALERT_PREFIX}{text} 🚨 {_RESET}\n\n", file)
 
     @staticmethod
-    def info(text: str, icon="ℹ️"):
+    def info(text: str, icon="ℹ️", file=None):
         """Print info message"""
-        print(f"{Colors.CYAN}{icon}  {text}{Colors.RESET}")
+        _write(f"{_INFO_COLOR}{icon}  {text}{_RESET}\n", file)
 
     @staticmethod
-    def status_box(title: str, items: list):
+    def status_box(title: str, items: list, file=None):
         """Print a status box with items"""
         width = 60
-        print(f"\n{Colors.BOLD}┌{'─' * (width-2)}┐")
-        print(f"│ {title.ljust(width-4)} │")
-        print(f"├{'─' * (width-2)}┤")
+        lines = [f"\n{_BOLD}{_BOX_TOP}", f"│ {title.ljust(width-4)} │", _BOX_DIVIDER]
         for item in items:
-            # Handle colored items
-            visible_len = len(item.replace(Colors.RESET, '').replace(Colors.GREEN, '')
-                             .replace(Colors.YELLOW, '').replace(Colors.RED, '')
-                             .replace(Colors.CYAN, '').replace(Colors.BOLD, ''))
+            # Handle colored items: pad by the text's visible width
+            visible_len = len(_ANSI_RE.sub('', item))
             padding = width - 4 - visible_len
-            print(f"│ {item}{' ' * padding} │")
-        print(f"└{'─' * (width-2)}┘{Colors.RESET}\n")
+            lines.append(f"│ {item}{' ' * padding} │")
+        lines.append(f"{_BOX_BOTTOM}{_RESET}\n\n")
+        _write("\n".join(lines), file)
 
     @staticmethod
-    def progress_bar(current: int, total: int, width: int = 40):
-        """Display a simple progress bar"""
+    @lru_cache(maxsize=128)
+    def render_progress_bar(current: int, total: int, width: int = 40) -> str:
+        """Render a simple progress bar as a string (cached per arguments)"""
         filled = int((current / total) * width)
         bar = '█' * filled + '░' * (width - filled)
         percent = int((current / total) * 100)
-        print(f"{Colors.CYAN}[{bar}] {percent}%{Colors.RESET}")
+        return f"{_PROGRESS_COLOR}[{bar}] {percent}%{_RESET}"
+
+    @staticmethod
+    def progress_bar(current: int, total: int, width: int = 40, file=None):
+        """Display a simple progress bar"""
+        _write(UI.render_progress_bar(current, total, width) + "\n", file)
 
     @staticmethod
-    def cycle_header(cycle_num: int, color=Colors.BRIGHT_CYAN):
+    def cycle_header(cycle_num: int, color=Colors.BRIGHT_CYAN, file=None):
         """Print a cycle header"""
-        print(f"\n{color}{Colors.BOLD}╔{'═' * 58}╗")
-        print(f"║{f'CYCLE {cycle_num}'.center(58)}║")
-        print(f"╚{'═' * 58}╝{Colors.RESET}")
+        top, bottom = _cycle_frame(color)
+        _write(f"{top}{f'CYCLE {cycle_num}'.center(58)}{bottom}", file)
 
     @staticmethod
-    def abnormality_gauge(percentage: float):
+    def abnormality_gauge(percentage: float, file=None):
         """Display abnormality as a visual gauge"""
-        # Determine color based on severity
-        if percentage < 30:
-            color = Colors.BRIGHT_GREEN
-            status = "NORMAL"
-        elif percentage < 45:
-            color = Colors.YELLOW
-            status = "ELEVATED"
-        elif percentage < 70:
-            color = Colors.BRIGHT_YELLOW
-            status = "HIGH"
-        else:
-            color = Colors.BRIGHT_RED
-            status = "CRITICAL"
-
-        # Create gauge
-        filled = int(percentage / 2)  # 50 chars = 100%
-        bar = '█' * filled + '░' * (50 - filled)
-
-        print(f"\n{Colors.BOLD}Abnormality Level:{Colors.RESET}")
-        print(f"{color}[{bar}] {int(percentage)}% - {status}{Colors.RESET}")
+        _write(_render_gauge(int(percentage)) + "\n", file)
+
+
+@lru_cache(maxsize=16)
+def _cycle_frame(color: str):
+    """
+    Return the fixed (top, bottom) parts of the cycle header box for a color.
+
+    Everything but the centered "CYCLE n" text is the same on every cycle,
+    so it is rendered once per color. The cycle number itself is not worth
+    caching: it grows by one each cycle and never repeats within a session.
+    """
+    return (f"\n{color}{_BOLD}{_CYCLE_TOP}\n║",
+            f"║\n{_CYCLE_BOTTOM}{_RESET}\n")
+
+
+@lru_cache(maxsize=101)
+def _render_gauge(level: int) -> str:
+    """Render the abnormality gauge for an integer level (cached, 0-100)"""
+    # Determine color based on severity
+    color, status = _GAUGE_STATES[bisect(_GAUGE_THRESHOLDS, level)]
+
+    # Create gauge
+    bar = _GAUGE_FILLS[level // 2]
+
+    return (f"\n{_BOLD}Abnormality Level:{_RESET}\n"
+            f"{color}[{bar}] {level}% - {status}{_RESET}")